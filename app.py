@@ -3,11 +3,25 @@
 
 from __future__ import annotations
 from pathlib import Path
+import os
+import tempfile
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from matplotlib.figure import Figure
+import altair as alt
 import streamlit as st
-import matplotlib.dates as mdates
-from matplotlib.ticker import MaxNLocator
+
+try:
+    from numba import njit
+except ImportError:  # numba optionnel: repli sur numpy.bincount
+    njit = None
+
+# Copy-on-Write: les filtres renvoient des vues, pas de copie complète du frame
+pd.set_option("mode.copy_on_write", True)
+# dtype "string" stocké en Arrow, y compris à la relecture du cache Parquet
+pd.set_option("mode.string_storage", "pyarrow")
 
 
 # =========================
@@ -19,6 +33,24 @@ DEFAULT_PATHS = [
     Path.home() / "Desktop" / "caisse_sale_clean.csv",
 ]
 
+# Frames préparés persistés en Parquet (évite de re-parser le CSV au démarrage)
+CACHE_DIR = Path("output_caisse/cache")
+CACHE_VERSION = 8  # à incrémenter quand prepare() change le schéma produit
+
+# Types connus du CSV clean (lecture pyarrow)
+# dates/heures restent en texte, parsées par prepare(): pyarrow convertirait les offsets (+01:00) en UTC
+CSV_TYPES = {
+    "item": pa.string(),
+    "payment": pa.string(),
+    "employee": pa.string(),
+    "ticket": pa.string(),
+    "dt_iso": pa.string(),
+    "dt": pa.string(),
+    "date": pa.string(),
+    "time": pa.string(),
+    "amount": pa.float64(),
+}
+
 
 # =========================
 # Helpers
@@ -26,80 +58,237 @@ DEFAULT_PATHS = [
 def euro(x: float) -> str:
     return f"{x:,.2f} €".replace(",", " ").replace(".", ",")
 
-@st.cache_data
-def load_csv(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path, encoding="utf-8", encoding_errors="ignore")
+def rewind(src):
+    # fichier importé (buffer) relu plusieurs fois: on revient au début
+    if hasattr(src, "seek"):
+        src.seek(0)
+    return src
+
+def read_caisse_csv(src) -> pd.DataFrame:
+    cols = pd.read_csv(rewind(src), nrows=0, encoding="utf-8", encoding_errors="ignore").columns
+    # pyarrow.csv direct: les types sont appliqués à la lecture (pd.read_csv les applique après)
+    options = pacsv.ConvertOptions(column_types={c: t for c, t in CSV_TYPES.items() if c in cols})
+    try:
+        table = pacsv.read_csv(rewind(str(src) if isinstance(src, Path) else src), convert_options=options)
+    except pa.ArrowInvalid:
+        # CSV non conforme (encodage, montants en texte...) -> lecture tolérante
+        return pd.read_csv(rewind(src), encoding="utf-8", encoding_errors="ignore")
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+def strip_offset(s: pd.Series) -> pd.Series:
+    # heure locale de la caisse: on retire Z / ±HH:MM (un export peut mélanger +01:00 et +02:00)
+    return s.astype("string[pyarrow]").str.replace(
+        r"(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(?:Z|[+-]\d{2}:?\d{2})$", r"\1", regex=True)
 
 def prepare(df: pd.DataFrame) -> pd.DataFrame:
     # Ton schéma final attendu: item, amount, payment, employee, ticket, date, time, dt_iso, dt
     if "dt_iso" in df.columns:
-        df["dt"] = pd.to_datetime(df["dt_iso"], errors="coerce")
+        df["dt"] = pd.to_datetime(strip_offset(df["dt_iso"]), errors="coerce")
     elif "dt" in df.columns:
-        df["dt"] = pd.to_datetime(df["dt"], errors="coerce")
+        df["dt"] = pd.to_datetime(strip_offset(df["dt"]), errors="coerce")
     else:
         # fallback date+time
         df["dt"] = pd.to_datetime(df["date"].astype(str) + " " + df["time"].astype(str),
                                   errors="coerce", dayfirst=True)
 
-    df = df.dropna(subset=["dt"]).copy()
+    if df["dt"].hasnans:
+        df = df.dropna(subset=["dt"])
 
-    # amount
-    df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
-    df = df.dropna(subset=["amount"]).copy()
-    df = df[df["amount"] > 0].copy()
+    # amount (déjà float si typé à la lecture)
+    if not pd.api.types.is_float_dtype(df["amount"]):
+        df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
+    df = df[df["amount"] > 0]  # NaN > 0 est faux: filtre aussi les montants manquants
+    # montants en centimes entiers: sommes exactes (cumul int64), /100 à l'affichage
+    cents = np.rint(df["amount"].to_numpy(dtype=np.float64) * 100)
+    # int32 tant que tous les montants tiennent (< 21 474 836,48 €), sinon int64: jamais de débordement
+    df["cents"] = cents.astype(np.int32 if cents.size == 0 or cents.max() < 2**31 else np.int64)
+    df = df.drop(columns="amount")
 
     # payment / item / employee / ticket
     for c in ["payment", "item", "employee", "ticket"]:
         if c not in df.columns:
             df[c] = "N/A"
-        df[c] = df[c].astype(str).str.strip()
+        df[c] = df[c].astype("string[pyarrow]").str.strip()
 
-    df["payment"] = df["payment"].str.upper()
-    df.loc[df["payment"] == "", "payment"] = "INCONNU"
+    df["payment"] = df["payment"].str.upper().fillna("")
+    df.loc[df["payment"] == "", "payment"] = "INCONNU"  # paiement vide ou manquant
+    # cellule vide ou manquante = "N/A", comme une colonne absente
+    for c in ["item", "employee", "ticket"]:
+        df[c] = df[c].fillna("").replace("", "N/A")
+
+    # colonnes peu variées -> category (groupby/filtres sur codes entiers)
+    # ticket reste en texte: quasi unique par ligne + recherche par sous-chaîne
+    for c in ["payment", "item", "employee"]:
+        df[c] = df[c].astype("category")  # catégories triées à la construction
 
     # time features
-    df["date_only"] = df["dt"].dt.date
-    df["hour"] = df["dt"].dt.hour
+    df["day_key"] = df["dt"].to_numpy().astype("datetime64[D]").astype(np.int32)  # jours depuis 1970-01-01
+    df["hour"] = df["dt"].dt.hour.astype(np.int8)
     df["weekday"] = df["dt"].dt.day_name()  # utile pour analyse jour semaine
 
     return df
 
+@st.cache_data(show_spinner=False, max_entries=4)  # frames complets: peu d'entrées
+def load_and_prepare(_src, src_key: str) -> pd.DataFrame:
+    # _src (chemin ou fichier importé) n'est pas hashé: src_key identifie la source
+    # (chemin + mtime + taille, ou file_id de l'upload) et invalide le cache si elle change
+    if not isinstance(_src, Path):
+        return prepare(read_caisse_csv(_src))
+
+    # cache lié à la version exacte du CSV (mtime + taille), pas seulement "plus récent"
+    stat = _src.stat()
+    cache = CACHE_DIR / f"{_src.stem}.{stat.st_mtime_ns}-{stat.st_size}.v{CACHE_VERSION}.parquet"
+    if cache.exists():
+        try:
+            return pd.read_parquet(cache, engine="pyarrow", memory_map=True)
+        except (OSError, ValueError):
+            pass  # cache illisible (écriture interrompue...): on repart du CSV
+
+    df = prepare(read_caisse_csv(_src))
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # écriture dans un fichier temporaire puis renommage atomique: jamais de Parquet tronqué
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+            os.replace(tmp, cache)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        for old in CACHE_DIR.glob(f"{_src.stem}.*.parquet"):
+            if old != cache:
+                old.unlink(missing_ok=True)
+    except (OSError, ValueError):
+        pass  # dossier en lecture seule, écriture impossible: le CSV reste la source
+    return df
+
+def to_day_key(d) -> int:
+    return int(np.datetime64(d, "D").astype(np.int64))
+
+def from_day_key(k: int):
+    return np.datetime64(int(k), "D").astype(object)  # -> datetime.date
+
+def cat_mask(s: pd.Series, selected: list) -> np.ndarray | None:
+    # None = toutes les valeurs sélectionnées, pas de filtre à appliquer
+    cats = s.cat.categories
+    if set(selected) >= set(cats):
+        return None
+    codes = cats.get_indexer(selected)
+    return np.isin(s.cat.codes.to_numpy(), codes[codes >= 0])
+
 def kpis(df: pd.DataFrame) -> dict:
     tx = int(len(df))
-    ca = float(df["amount"].sum()) if tx else 0.0
-    panier = float(df["amount"].mean()) if tx else 0.0
+    ca = int(df["cents"].to_numpy().sum(dtype=np.int64)) / 100 if tx else 0.0
+    panier = ca / tx if tx else 0.0
     return {"tx": tx, "ca": ca, "panier": panier}
 
-def insights_auto(df: pd.DataFrame) -> list[str]:
+def _agg_hour_pay_np(hour, pay_code, cents, n_pay):
+    # poids float64: exact pour des sommes de centimes < 2**53
+    out_h = np.bincount(hour, weights=cents, minlength=24).astype(np.int64)
+    out_p = np.bincount(pay_code, weights=cents, minlength=n_pay).astype(np.int64)
+    out_p_cnt = np.bincount(pay_code, minlength=n_pay)
+    return out_h, out_p, out_p_cnt
+
+if njit is not None:
+    @njit(cache=True)
+    def agg_hour_pay(hour, pay_code, cents, n_pay):
+        # une seule passe pour CA/heure + CA et nb de transactions par paiement
+        # (séquentiel: un prange ferait des += concurrents sur les mêmes cases)
+        out_h = np.zeros(24, np.int64)
+        out_p = np.zeros(n_pay, np.int64)
+        out_p_cnt = np.zeros(n_pay, np.int64)
+        for i in range(len(cents)):
+            out_h[hour[i]] += cents[i]
+            out_p[pay_code[i]] += cents[i]
+            out_p_cnt[pay_code[i]] += 1
+        return out_h, out_p, out_p_cnt
+else:
+    agg_hour_pay = _agg_hour_pay_np
+
+def aggregates(df: pd.DataFrame) -> dict:
+    # Une seule passe groupby par axe, partagée entre insights et graphes
+    # hour ∈ [0, 24) et codes paiement: agrégés par position, sans table de hachage
+    pay_cats = df["payment"].cat.categories
+    out_h, out_p, out_p_cnt = agg_hour_pay(
+        df["hour"].to_numpy(), df["payment"].cat.codes.to_numpy(), df["cents"].to_numpy(), len(pay_cats),
+    )
+    cents = df["cents"].astype(np.int64)  # groupby.sum garde l'int32 d'entrée: risque de débordement
+    ca_hour = pd.Series(out_h / 100, index=np.arange(24))
+    pay_agg = pd.DataFrame({"ca": out_p / 100, "tx": out_p_cnt}, index=pay_cats)
+
+    # Part CB / espèces: codes résolus une fois, lecture par position dans out_p
+    cb, cash = pay_cats.get_indexer(["CB", "ESPECES"])  # -1 si absent du fichier
+    ca_total = out_p.sum()
+    shares = None
+    if ca_total > 0 and ((cb >= 0 and out_p_cnt[cb]) or (cash >= 0 and out_p_cnt[cash])):
+        shares = (
+            float(out_p[cb] / ca_total) if cb >= 0 else 0.0,
+            float(out_p[cash] / ca_total) if cash >= 0 else 0.0,
+        )
+    return {
+        "hour": ca_hour[ca_hour > 0],  # montants > 0: un bin vide = aucune vente
+        "pay": pay_agg[pay_agg["tx"] > 0],  # CA + nb transactions, partagé insights/camemberts
+        "item": cents.groupby(df["item"], observed=True).sum() / 100,
+        "emp": cents.groupby(df["employee"], observed=True).sum() / 100,
+        "day": cents.groupby(df["day_key"], observed=True).sum() / 100,
+        "shares": shares,
+    }
+
+def filter_frame(df: pd.DataFrame, start_k: int, end_k: int, pay_sel: tuple, emp_sel: tuple,
+                 item_sel: tuple, ticket_search: str) -> pd.DataFrame:
+    day_keys = df["day_key"].to_numpy()
+    masks = [day_keys >= start_k, day_keys <= end_k]
+    for col, sel in [("payment", pay_sel), ("employee", emp_sel), ("item", item_sel)]:
+        m_col = cat_mask(df[col], list(sel))
+        if m_col is not None:
+            masks.append(m_col)
+    df_f = df.loc[np.logical_and.reduce(masks)]
+    if ticket_search:
+        # ticket est en string[pyarrow]: regex=False -> pyarrow.compute.match_substring
+        df_f = df_f[df_f["ticket"].str.contains(ticket_search, case=False, regex=False, na=False)]
+    return df_f
+
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
+def compute_aggregates(_src, src_key: str, start_k: int, end_k: int, pay_sel: tuple,
+                       emp_sel: tuple, item_sel: tuple, ticket_search: str) -> dict:
+    # Clé de cache = signature des filtres: revenir sur un filtre déjà vu est immédiat
+    df_f = filter_frame(load_and_prepare(_src, src_key), start_k, end_k,
+                        pay_sel, emp_sel, item_sel, ticket_search)
+    return {**aggregates(df_f), "kpis": kpis(df_f)}
+
+def new_fig() -> tuple:
+    # Figure() directe: hors du gestionnaire pyplot, libérée avec la session
+    fig = Figure()
+    return fig, fig.subplots()
+
+def insights_auto(agg: dict) -> list[str]:
     msgs = []
-    if len(df) == 0:
+    if agg["hour"].empty:
         return ["Aucune donnée sur ces filtres."]
 
     # Heures creuses/fortes (sur CA)
-    ca_hour = df.groupby("hour")["amount"].sum().sort_values(ascending=False)
-    top = ca_hour.head(3)
-    low = ca_hour.tail(3).sort_values()
+    ca_hour = agg["hour"]
+    top = ca_hour.nlargest(3)
+    low = ca_hour.nsmallest(3)
 
     msgs.append(f"**Heures fortes (Top 3)** : " + ", ".join([f"{h}h ({euro(v)})" for h, v in top.items()]))
     msgs.append(f"**Heures creuses (Top 3)** : " + ", ".join([f"{h}h ({euro(v)})" for h, v in low.items()]))
 
     # Part CB / espèces
-    ca_pay = df.groupby("payment")["amount"].sum()
-    ca_total = ca_pay.sum()
-    if ca_total > 0 and ("CB" in ca_pay.index or "ESPECES" in ca_pay.index):
-        share_cb = float(ca_pay.get("CB", 0.0) / ca_total)
-        share_cash = float(ca_pay.get("ESPECES", 0.0) / ca_total)
+    if agg["shares"] is not None:
+        share_cb, share_cash = agg["shares"]
         msgs.append(f"**Répartition CA** : CB ~ **{share_cb*100:.1f}%** | Espèces ~ **{share_cash*100:.1f}%**")
 
     # Top prestation + top employé
-    top_item = df.groupby("item")["amount"].sum().sort_values(ascending=False).head(1)
-    if len(top_item):
-        it, v = top_item.index[0], float(top_item.iloc[0])
+    ca_item = agg["item"]
+    if len(ca_item):
+        it, v = ca_item.idxmax(), float(ca_item.max())
         msgs.append(f"**Prestation #1** : {it} ({euro(v)})")
 
-    top_emp = df.groupby("employee")["amount"].sum().sort_values(ascending=False).head(1)
-    if len(top_emp):
-        emp, v = top_emp.index[0], float(top_emp.iloc[0])
+    ca_emp = agg["emp"]
+    if len(ca_emp):
+        emp, v = ca_emp.idxmax(), float(ca_emp.max())
         msgs.append(f"**Employé #1 (CA)** : {emp} ({euro(v)})")
 
     # Suggestion business simple
@@ -120,60 +309,52 @@ uploaded = None
 if use_upload:
     uploaded = st.sidebar.file_uploader("CSV caisse nettoyé", type=["csv"])
 
-data_path = None
+src = src_key = src_name = None
 if uploaded is not None:
-    tmp = Path("uploaded_caisse_clean.csv")
-    tmp.write_bytes(uploaded.getbuffer())
-    data_path = tmp
+    # lu directement depuis le buffer, sans fichier temporaire
+    src, src_key, src_name = uploaded, f"upload:{uploaded.file_id}", uploaded.name
 else:
     for p in DEFAULT_PATHS:
         if p.exists():
-            data_path = p
+            stat = p.stat()
+            src, src_key, src_name = p, f"{p.as_posix()}:{stat.st_mtime_ns}:{stat.st_size}", p.as_posix()
             break
 
-if data_path is None:
+if src is None:
     st.error("Aucun fichier trouvé. Place 'caisse_clean.csv' dans output_caisse/data_clean/ ou importe un CSV.")
     st.stop()
 
-df0 = load_csv(data_path)
-df = prepare(df0)
+df = load_and_prepare(src, src_key)
 
-st.sidebar.success(f"Fichier chargé : {data_path.as_posix()}")
+st.sidebar.success(f"Fichier chargé : {src_name}")
 st.sidebar.caption(f"Lignes : {len(df)}")
 
 # Filtres
 st.sidebar.header("Filtres")
-min_d = df["date_only"].min()
-max_d = df["date_only"].max()
+min_d = from_day_key(df["day_key"].min())
+max_d = from_day_key(df["day_key"].max())
 date_range = st.sidebar.date_input("Période", value=(min_d, max_d), min_value=min_d, max_value=max_d)
 
-payments = sorted(df["payment"].unique())
+payments = df["payment"].cat.categories.tolist()
 pay_sel = st.sidebar.multiselect("Paiement", payments, default=payments)
 
-employees = sorted(df["employee"].unique())
+employees = df["employee"].cat.categories.tolist()
 emp_sel = st.sidebar.multiselect("Employé", employees, default=employees)
 
-items = sorted(df["item"].unique())
+items = df["item"].cat.categories.tolist()
 item_sel = st.sidebar.multiselect("Prestation", items, default=items)
 
 ticket_search = st.sidebar.text_input("Recherche ticket (optionnel)", value="").strip()
 
 # Application filtres
 start_d, end_d = date_range
-mask = (
-    (df["date_only"] >= start_d) &
-    (df["date_only"] <= end_d) &
-    (df["payment"].isin(pay_sel)) &
-    (df["employee"].isin(emp_sel)) &
-    (df["item"].isin(item_sel))
+agg = compute_aggregates(
+    src, src_key, to_day_key(start_d), to_day_key(end_d),
+    tuple(sorted(pay_sel)), tuple(sorted(emp_sel)), tuple(sorted(item_sel)), ticket_search,
 )
 
-df_f = df[mask].copy()
-if ticket_search:
-    df_f = df_f[df_f["ticket"].str.contains(ticket_search, case=False, na=False)].copy()
-
 # KPI
-m = kpis(df_f)
+m = agg["kpis"]
 c1, c2, c3, c4 = st.columns(4)
 c1.metric("Transactions", f"{m['tx']:,}".replace(",", " "))
 c2.metric("Chiffre d’affaires", euro(m["ca"]))
@@ -182,33 +363,42 @@ c4.metric("Période", f"{start_d} → {end_d}")
 
 # Insights auto
 st.subheader("🧠 Insights automatiques (pilotage)")
-for msg in insights_auto(df_f):
+for msg in insights_auto(agg):
     st.markdown(f"- {msg}")
 
-# Graphs
+# Camemberts: figures créées une fois par session, axes vidés puis redessinés à chaque rerun
+if "figs" not in st.session_state:
+    st.session_state.figs = {
+        "pie_ca": new_fig(),
+        "pie_tx": new_fig(),
+    }
+figs = st.session_state.figs
+
 g1, g2 = st.columns(2)
 
 with g1:
     st.subheader("🥧 Répartition CA — CB vs Espèces")
-    if len(df_f) == 0:
+    if m["tx"] == 0:
         st.info("Aucune donnée.")
     else:
-        ca_pay = df_f.groupby("payment")["amount"].sum().sort_values(ascending=False)
-        fig = plt.figure()
-        plt.pie(ca_pay.values, labels=ca_pay.index, autopct="%1.1f%%")
-        plt.title("CA par paiement")
-        st.pyplot(fig, clear_figure=True)
+        ca_pay = agg["pay"]["ca"].sort_values(ascending=False)
+        fig, ax = figs["pie_ca"]
+        ax.cla()
+        ax.pie(ca_pay.values, labels=ca_pay.index, autopct="%1.1f%%")
+        ax.set_title("CA par paiement")
+        st.pyplot(fig, clear_figure=False)
 
 with g2:
     st.subheader("🧾 Répartition Transactions — CB vs Espèces")
-    if len(df_f) == 0:
+    if m["tx"] == 0:
         st.info("Aucune donnée.")
     else:
-        tx_pay = df_f["payment"].value_counts()
-        fig = plt.figure()
-        plt.pie(tx_pay.values, labels=tx_pay.index, autopct="%1.1f%%")
-        plt.title("Transactions par paiement")
-        st.pyplot(fig, clear_figure=True)
+        tx_pay = agg["pay"]["tx"].sort_values(ascending=False)
+        fig, ax = figs["pie_tx"]
+        ax.cla()
+        ax.pie(tx_pay.values, labels=tx_pay.index, autopct="%1.1f%%")
+        ax.set_title("Transactions par paiement")
+        st.pyplot(fig, clear_figure=False)
 
 st.divider()
 
@@ -216,46 +406,32 @@ h1, h2 = st.columns(2)
 
 with h1:
     st.subheader("⏰ CA par heure")
-    if len(df_f) == 0:
+    if m["tx"] == 0:
         st.info("Aucune donnée.")
     else:
-        ca_hour = df_f.groupby("hour")["amount"].sum().sort_index()
-
-        fig, ax = plt.subplots(figsize=(9, 4.5), dpi=120)
-        ax.bar(ca_hour.index.astype(int), ca_hour.values)
-
-        ax.set_xlabel("Heure")
-        ax.set_ylabel("CA (€)")
-        ax.set_title("CA par heure")
-
-        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
-        if ca_hour.index.nunique() > 10:
-            ax.set_xticks(ca_hour.index.astype(int)[::2])
-
-        ax.grid(axis="y", alpha=0.25)
-        fig.tight_layout()
-        st.pyplot(fig, clear_figure=True)
+        # toutes les heures entre la première et la dernière vente: les creux restent visibles
+        ca_hour = agg["hour"]
+        ca_hour = ca_hour.reindex(range(ca_hour.index.min(), ca_hour.index.max() + 1), fill_value=0.0)
+        data = pd.DataFrame({"heure": ca_hour.index.astype(int), "ca": ca_hour.to_numpy()})
+        data["ca_txt"] = [euro(v) for v in data["ca"]]
+        chart = alt.Chart(data, title="CA par heure").mark_bar().encode(
+            x=alt.X("heure:O", title="Heure", axis=alt.Axis(labelAngle=0)),
+            y=alt.Y("ca:Q", title="CA (€)"),
+            tooltip=[alt.Tooltip("heure:O", title="Heure"), alt.Tooltip("ca_txt:N", title="CA")],
+        )
+        st.altair_chart(chart, use_container_width=True)
 
 with h2:
     st.subheader("📈 CA par jour")
-    if len(df_f) == 0:
+    if m["tx"] == 0:
         st.info("Aucune donnée.")
     else:
-        ca_day = df_f.groupby("date_only")["amount"].sum().sort_index()
-        x = pd.to_datetime(ca_day.index)
-        y = ca_day.values
-
-        fig, ax = plt.subplots(figsize=(10, 4.5), dpi=120)
-        ax.plot(x, y, marker="o", linewidth=2)
-
-        ax.set_xlabel("Date")
-        ax.set_ylabel("CA (€)")
-        ax.set_title("CA par jour")
-
-        locator = mdates.AutoDateLocator(minticks=5, maxticks=8)
-        ax.xaxis.set_major_locator(locator)
-        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
-
-        ax.grid(alpha=0.25)
-        fig.tight_layout()
-        st.pyplot(fig, clear_figure=True)
+        ca_day = agg["day"]
+        data = pd.DataFrame({"date": ca_day.index.to_numpy().astype("datetime64[D]"), "ca": ca_day.to_numpy()})
+        data["ca_txt"] = [euro(v) for v in data["ca"]]
+        chart = alt.Chart(data, title="CA par jour").mark_line(point=True, strokeWidth=2).encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y("ca:Q", title="CA (€)"),
+            tooltip=[alt.Tooltip("date:T", title="Date", format="%d/%m/%Y"), alt.Tooltip("ca_txt:N", title="CA")],
+        )
+        st.altair_chart(chart, use_container_width=True)